@@ -0,0 +1,111 @@
+"""
+Per-frame physics kernels for Planetoids
+
+Bullets are stored as parallel arrays (see BulletPool in planetoids.py).
+When Numba is installed these kernels are compiled to native code; otherwise
+equivalent NumPy implementations are used.
+"""
+
+import numpy as np
+try:
+    from numba import njit, boolean, float64, int64, intp, void
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    # Explicit signatures compile (or load from the on-disk cache) at import,
+    # before the window opens, rather than stalling the first frame of play.
+    # They also pin the argument types: positions are contiguous float64
+    # arrays, masks are bool arrays and sizes are ints.
+    _positions = float64[::1]
+    _mask = boolean[::1]
+    
+    @njit(void(_positions, _positions, _positions, _positions, _mask, float64, int64, int64), 
+          cache=True, fastmath=True)
+    def step(px, py, vx, vy, active, dt, w, h):
+        """Advance active entities by dt and wrap them around a w x h area"""
+        for i in range(px.shape[0]):
+            if not active[i]:
+                continue
+            x = px[i] + vx[i] * dt
+            y = py[i] + vy[i] * dt
+            # Entities move far less than a screen per step, so a single
+            # add/subtract wraps them; these compile to conditional moves
+            if x < 0:
+                x += w
+            elif x >= w:
+                x -= w
+            if y < 0:
+                y += h
+            elif y >= h:
+                y -= h
+            px[i] = x
+            py[i] = y
+
+    @njit(intp[:, ::1](_positions, _positions, int64, _mask, _positions, _positions, _positions, _mask), 
+          cache=True, fastmath=True)
+    def bullet_hits(bpx, bpy, br, active_b, tpx, tpy, tr, active_t):
+        """Return (bullet, target) index pairs of overlapping circles, ordered by bullet"""
+        # Hits are rare, so start small and double the output as needed
+        # rather than reserving a slot for every bullet/target pair
+        pairs = np.empty((16, 2), dtype=np.intp)
+        if tpx.shape[0] == 0:
+            return pairs[:0]
+        
+        # Sweep and prune on x: with targets sorted by left edge, a bullet
+        # can only overlap targets whose left edge lies within reach of it
+        left = tpx - tr
+        order = np.argsort(left)
+        left_sorted = left[order]
+        reach = br + 2.0 * tr.max()
+        
+        n = 0
+        for i in range(bpx.shape[0]):
+            if not active_b[i]:
+                continue
+            lo = np.searchsorted(left_sorted, bpx[i] - reach)
+            hi = np.searchsorted(left_sorted, bpx[i] + br)
+            start = n
+            for k in range(lo, hi):
+                j = order[k]
+                if not active_t[j]:
+                    continue
+                dx = bpx[i] - tpx[j]
+                dy = bpy[i] - tpy[j]
+                r = br + tr[j]
+                if dx*dx + dy*dy < r*r:
+                    if n == pairs.shape[0]:
+                        grown = np.empty((2 * n, 2), dtype=np.intp)
+                        grown[:n] = pairs
+                        pairs = grown
+                    pairs[n, 0] = i
+                    pairs[n, 1] = j
+                    n += 1
+            # Report each bullet's hits in target order, as the caller expects
+            if n - start > 1:
+                pairs[start:n] = pairs[start:n][np.argsort(pairs[start:n, 1])]
+        return pairs[:n]
+else:
+    def step(px, py, vx, vy, active, dt, w, h):
+        """Advance active entities by dt and wrap them around a w x h area"""
+        # Inactive slots are moved too; it is cheaper than masking
+        px += vx * dt
+        py += vy * dt
+        np.mod(px, w, out=px)
+        np.mod(py, h, out=py)
+
+    def bullet_hits(bpx, bpy, br, active_b, tpx, tpy, tr, active_t):
+        """Return (bullet, target) index pairs of overlapping circles, ordered by bullet"""
+        bullets = np.flatnonzero(active_b)
+        targets = np.flatnonzero(active_t)
+        if not bullets.size or not targets.size:
+            return np.empty((0, 2), dtype=np.intp)
+
+        dx = bpx[bullets, None] - tpx[None, targets]
+        dy = bpy[bullets, None] - tpy[None, targets]
+        r = tr[None, targets] + br
+        pairs = np.argwhere(dx*dx + dy*dy < r*r)
+        pairs[:, 0] = bullets[pairs[:, 0]]
+        pairs[:, 1] = targets[pairs[:, 1]]
+        return pairs
@@ -5,12 +5,16 @@ Inspired by the 1981 Macronics game for Sinclair ZX81
 """
 
 import pygame
+import pygame.freetype
 import math
+import os
+import numpy as np
 import random
-import sys
-from typing import List, Tuple
-from dataclasses import dataclass
+from collections import OrderedDict
+from itertools import chain
+from typing import Dict, List, Tuple
 from enum import Enum
+import physics
 try:
     from pygame_screen_recorder import pygame_screen_recorder
     RECORDER_AVAILABLE = True
@@ -28,7 +32,29 @@ GAME_WIDTH = 640
 GAME_HEIGHT = 480
 GAME_X_OFFSET = (WINDOW_WIDTH - GAME_WIDTH) // 2
 GAME_Y_OFFSET = 60  # Leave space for TV frame at top
+GAME_CX = GAME_WIDTH // 2
+GAME_CY = GAME_HEIGHT // 2
 FPS = 60
+IDLE_FPS = 15  # Frame cap while nothing on screen is animating
+FIXED_DT = 1 / 120  # Simulation step, independent of the frame rate
+MAX_FRAME_TIME = 0.25  # Longest stall the simulation will catch up on
+
+# Window regions pushed to the display each frame; the TV frame and keyboard
+# around them are static and only painted once
+GAME_RECT = pygame.Rect(GAME_X_OFFSET, GAME_Y_OFFSET, GAME_WIDTH, GAME_HEIGHT)
+REC_RECT = pygame.Rect(WINDOW_WIDTH - 65, 5, 60, 30)
+BACKGROUND_COLOR = (30, 30, 30)
+TEXT_CACHE_SIZE = 128  # Rendered text surfaces kept around
+
+# Text layout (centers on the game surface, except the brand label on the window)
+DAMAGE_TEXT_CENTER = (GAME_CX, 50)
+MENU_TITLE_CENTER = (GAME_CX, GAME_CY - 100)
+MENU_SUBTITLE_CENTER = (GAME_CX, GAME_CY - 70)
+MENU_INSTRUCTIONS_TOP = GAME_CY - 20
+GAME_OVER_TITLE_CENTER = (GAME_CX, GAME_CY - 50)
+GAME_OVER_SCORE_CENTER = (GAME_CX, GAME_CY)
+GAME_OVER_RESTART_CENTER = (GAME_CX, GAME_CY + 50)
+BRAND_CENTER = (WINDOW_WIDTH // 2, GAME_Y_OFFSET - 25)
 
 # Colors (ZX81 inspired - black and white with some accent colors)
 BLACK = (0, 0, 0)
@@ -38,39 +64,54 @@ RED = (255, 0, 0)
 YELLOW = (255, 255, 0)
 BLUE = (0, 100, 255)
 
+# Unit heading vectors (sin, -cos) for each whole degree; 0 degrees points up
+_SIN = [math.sin(math.radians(i)) for i in range(360)]
+_NCOS = [-math.cos(math.radians(i)) for i in range(360)]
+_LUT_PER_RADIAN = 360 / (2 * math.pi)  # Scales a heading in radians to a table index
+
+# Sound effect palette, synthesized once at startup: name -> (frequency Hz, duration s, volume)
+SOUND_EFFECTS = {
+    "shoot": (600, 0.1, 0.05),
+    "explosion_1": (150, 0.3, 0.08),
+    "explosion_2": (150, 0.4, 0.08),
+    "explosion_3": (150, 0.5, 0.08),
+    "hit_asteroid": (200, 0.2, 0.1),
+    "hit_alien_ship": (800, 0.3, 0.1),
+    "hit_alien_bullet": (1200, 0.15, 0.1),
+    "hit_hyperspace": (400, 0.4, 0.1),
+}
+
 class GameState(Enum):
     MENU = 1
     PLAYING = 2
     GAME_OVER = 3
     PAUSED = 4
 
+# State reached by pressing P; other states are left unchanged
+PAUSE_TOGGLE = {GameState.PLAYING: GameState.PAUSED, GameState.PAUSED: GameState.PLAYING}
+
 class DamageType(Enum):
     ASTEROID = 1
     ALIEN_SHIP = 2
     ALIEN_BULLET = 3
     HYPERSPACE = 4
 
-@dataclass
 class Vector2:
-    x: float
-    y: float
+    # Slots instead of a per-instance __dict__: smaller and faster attribute access
+    __slots__ = ('x', 'y')
     
-    def __add__(self, other):
-        return Vector2(self.x + other.x, self.y + other.y)
-    
-    def __mul__(self, scalar):
-        return Vector2(self.x * scalar, self.y * scalar)
-    
-    def magnitude(self):
-        return math.sqrt(self.x**2 + self.y**2)
+    def __init__(self, x: float, y: float):
+        self.x = x
+        self.y = y
     
-    def normalize(self):
-        mag = self.magnitude()
-        if mag == 0:
-            return Vector2(0, 0)
-        return Vector2(self.x / mag, self.y / mag)
+    def __repr__(self):
+        return f"Vector2(x={self.x}, y={self.y})"
 
 class GameObject:
+    # Fixed attribute slots keep the numerous game objects compact and make
+    # their hot attribute loads cheaper than __dict__ lookups
+    __slots__ = ('position', 'velocity', 'rotation', 'radius', 'active')
+    
     def __init__(self, x: float, y: float):
         self.position = Vector2(x, y)
         self.velocity = Vector2(0, 0)
@@ -79,30 +120,36 @@ class GameObject:
         self.active = True
     
     def update(self, dt: float):
-        # Update position
-        self.position = self.position + self.velocity * dt
-        
-        # Wrap around game area edges
-        self.position.x = self.position.x % GAME_WIDTH
-        self.position.y = self.position.y % GAME_HEIGHT
-    
-    def draw(self, screen):
-        pass
+        # Update position in place
+        position = self.position
+        x = position.x + self.velocity.x * dt
+        y = position.y + self.velocity.y * dt
+        
+        # Wrap around game area edges; objects move far less than a screen
+        # per frame, so one add or subtract replaces a float modulo
+        if x < 0:
+            x += GAME_WIDTH
+        elif x >= GAME_WIDTH:
+            x -= GAME_WIDTH
+        if y < 0:
+            y += GAME_HEIGHT
+        elif y >= GAME_HEIGHT:
+            y -= GAME_HEIGHT
+        
+        position.x = x
+        position.y = y
     
-    def collides_with(self, other) -> bool:
-        if not (self.active and other.active):
-            return False
-        
-        distance = math.sqrt((self.position.x - other.position.x)**2 + 
-                           (self.position.y - other.position.y)**2)
-        return distance < (self.radius + other.radius)
+    def sprite(self):
+        """Return the (image, position) to blit this frame, or None when hidden"""
+        return None
 
 class Ship(GameObject):
     def __init__(self, x: float, y: float):
         super().__init__(x, y)
         self.radius = 8
         self.thrust_power = 200
-        self.rotation_speed = 300  # degrees per second
+        self.rotation = 0.0  # radians; 0 points up
+        self.rotation_speed = math.radians(300)  # 300 degrees per second
         self.max_speed = 300
         
         # Fuel system
@@ -125,11 +172,16 @@ class Ship(GameObject):
         self.damage_type = None  # Type of damage for different flash colors
         
         # Ship shape (triangle pointing up)
-        self.shape = [
-            Vector2(0, -8),   # nose
-            Vector2(-6, 6),   # left wing
-            Vector2(6, 6)     # right wing
-        ]
+        self.shape = np.array([
+            (0, -8),   # nose
+            (-6, 6),   # left wing
+            (6, 6)     # right wing
+        ], dtype=np.float32)
+        
+        # Render the ship once, then rotate copies of it per whole degree
+        self._base_surf = pygame.Surface((32, 32), pygame.SRCALPHA).convert_alpha()
+        pygame.draw.polygon(self._base_surf, WHITE, (self.shape + 16).tolist())
+        self._rotation_cache = {}
     
     def update(self, dt: float):
         super().update(dt)
@@ -147,25 +199,29 @@ class Ship(GameObject):
             self.flash_intensity = 0.0
             self.damage_type = None
         
-        # Apply drag
-        drag = 0.98
-        self.velocity = self.velocity * drag
+        # Apply drag; 0.98 per 60 Hz frame, scaled so handling is independent of the step
+        drag = 0.98 ** (dt * FPS)
+        self.velocity.x *= drag
+        self.velocity.y *= drag
     
     def thrust(self, dt: float):
         if self.fuel <= 0:
             return
             
         # Calculate thrust direction
-        thrust_x = math.sin(math.radians(self.rotation)) * self.thrust_power * dt
-        thrust_y = -math.cos(math.radians(self.rotation)) * self.thrust_power * dt
-        
-        self.velocity.x += thrust_x
-        self.velocity.y += thrust_y
-        
-        # Limit max speed
-        if self.velocity.magnitude() > self.max_speed:
-            normalized = self.velocity.normalize()
-            self.velocity = normalized * self.max_speed
+        i = int(self.rotation * _LUT_PER_RADIAN) % 360
+        self.velocity.x += _SIN[i] * self.thrust_power * dt
+        self.velocity.y += _NCOS[i] * self.thrust_power * dt
+        
+        # Limit max speed, scaling in place with a single sqrt
+        vx = self.velocity.x
+        vy = self.velocity.y
+        mag2 = vx*vx + vy*vy
+        cap = self.max_speed
+        if mag2 > cap*cap:
+            scale = cap / math.sqrt(mag2)
+            self.velocity.x = vx * scale
+            self.velocity.y = vy * scale
         
         # Consume fuel
         self.fuel -= 50 * dt
@@ -174,7 +230,7 @@ class Ship(GameObject):
     
     def rotate(self, direction: int, dt: float):
         self.rotation += direction * self.rotation_speed * dt
-        self.rotation = self.rotation % 360
+        self.rotation = self.rotation % (2 * math.pi)
     
     def hyperspace(self, game=None):
         if self.hyperspace_cooldown <= 0:
@@ -213,40 +269,15 @@ class Ship(GameObject):
         """Play appropriate sound effect for damage type"""
         if not game:
             return
-            
-        try:
-            # Generate different tones for different damage types
-            if damage_type == DamageType.ASTEROID:
-                # Low thud sound
-                game.generate_sound(200, 0.2)
-            elif damage_type == DamageType.ALIEN_SHIP:
-                # Sharp crash sound
-                game.generate_sound(800, 0.3)
-            elif damage_type == DamageType.ALIEN_BULLET:
-                # High pitched zap
-                game.generate_sound(1200, 0.15)
-            elif damage_type == DamageType.HYPERSPACE:
-                # Warbling sound
-                game.generate_sound(400, 0.4)
-        except:
-            pass  # Ignore sound errors
-    
-    def generate_sound(self, frequency: int, duration: float):
-        """Generate a simple tone for sound effects"""
-        try:
-            sample_rate = 22050
-            frames = int(duration * sample_rate)
-            arr = []
-            for i in range(frames):
-                time_point = float(i) / sample_rate
-                wave = 4096 * math.sin(frequency * 2 * math.pi * time_point)
-                arr.append([int(wave), int(wave)])
-            
-            sound = pygame.sndarray.make_sound(pygame.array.array('i', arr))
-            sound.set_volume(0.1)  # Keep volume low
-            sound.play()
-        except:
-            pass  # Ignore sound generation errors
+        
+        # Different tones for different damage types
+        hit_sounds = {
+            DamageType.ASTEROID: "hit_asteroid",          # Low thud sound
+            DamageType.ALIEN_SHIP: "hit_alien_ship",      # Sharp crash sound
+            DamageType.ALIEN_BULLET: "hit_alien_bullet",  # High pitched zap
+            DamageType.HYPERSPACE: "hit_hyperspace"       # Warbling sound
+        }
+        game.play_sound(hit_sounds[damage_type])
     
     def get_flash_color(self) -> tuple:
         """Get the appropriate flash color based on damage type and intensity"""
@@ -270,59 +301,36 @@ class Ship(GameObject):
         
         return (flash_r, flash_g, flash_b)
     
-    def draw(self, screen):
+    def sprite(self):
         if not self.active:
-            return
+            return None
             
         # Don't draw if invulnerable and blinking
         if self.invulnerable_time > 0 and int(self.invulnerable_time * 10) % 2:
-            return
+            return None
         
         # Get appropriate ship color based on damage flash
         ship_color = self.get_flash_color()
         
-        # Transform ship shape based on rotation
-        transformed_points = []
-        for point in self.shape:
-            # Rotate point
-            cos_r = math.cos(math.radians(self.rotation))
-            sin_r = math.sin(math.radians(self.rotation))
-            
-            rotated_x = point.x * cos_r - point.y * sin_r
-            rotated_y = point.x * sin_r + point.y * cos_r
-            
-            # Translate to ship position
-            final_x = rotated_x + self.position.x
-            final_y = rotated_y + self.position.y
-            
-            transformed_points.append((final_x, final_y))
+        # Rotated ship sprite, cached by whole degree
+        angle = int(self.rotation * _LUT_PER_RADIAN) % 360
+        ship_surf = self._rotation_cache.get(angle)
+        if ship_surf is None:
+            ship_surf = pygame.transform.rotate(self._base_surf, -angle)
+            self._rotation_cache[angle] = ship_surf
         
-        pygame.draw.polygon(screen, ship_color, transformed_points)
-
-class Bullet(GameObject):
-    def __init__(self, x: float, y: float, rotation: float):
-        super().__init__(x, y)
-        self.radius = 2
-        self.lifetime = 2.0  # Bullets last 2 seconds
+        # Tint a copy of the white sprite while the damage flash is showing
+        if ship_color != WHITE:
+            ship_surf = ship_surf.copy()
+            ship_surf.fill(ship_color, special_flags=pygame.BLEND_RGB_MULT)
         
-        # Set velocity based on rotation
-        speed = 400
-        self.velocity.x = math.sin(math.radians(rotation)) * speed
-        self.velocity.y = -math.cos(math.radians(rotation)) * speed
-    
-    def update(self, dt: float):
-        super().update(dt)
-        self.lifetime -= dt
-        if self.lifetime <= 0:
-            self.active = False
-    
-    def draw(self, screen):
-        if self.active:
-            pygame.draw.circle(screen, WHITE, 
-                             (int(self.position.x), int(self.position.y)), 
-                             self.radius)
+        return ship_surf, ship_surf.get_rect(center=(self.position.x, self.position.y))
 
 class Asteroid(GameObject):
+    __slots__ = ('size', 'rotation_speed', 'shape', '_rot_cache')
+    
+    rotation_step = 10  # Degrees per pre-rendered rotation
+    
     def __init__(self, x: float, y: float, size: int = 3):
         super().__init__(x, y)
         self.size = size  # 1=small, 2=medium, 3=large
@@ -336,7 +344,7 @@ class Asteroid(GameObject):
         self.velocity.y = -math.cos(math.radians(angle)) * speed
         
         # Generate random asteroid shape
-        self.shape = []
+        shape = []
         num_points = 8
         for i in range(num_points):
             angle = (360 / num_points) * i
@@ -345,7 +353,11 @@ class Asteroid(GameObject):
             
             x = math.sin(math.radians(angle)) * radius
             y = -math.cos(math.radians(angle)) * radius
-            self.shape.append(Vector2(x, y))
+            shape.append((x, y))
+        self.shape = np.array(shape, dtype=np.float32)
+        
+        # Outline sprites per rotation step, rendered on first use
+        self._rot_cache = [None] * (360 // self.rotation_step)
     
     def update(self, dt: float):
         super().update(dt)
@@ -370,29 +382,40 @@ class Asteroid(GameObject):
         
         return new_asteroids
     
-    def draw(self, screen):
+    def sprite(self):
         if not self.active:
-            return
+            return None
         
-        # Transform asteroid shape
-        transformed_points = []
-        for point in self.shape:
-            # Rotate point
-            cos_r = math.cos(math.radians(self.rotation))
-            sin_r = math.sin(math.radians(self.rotation))
-            
-            rotated_x = point.x * cos_r - point.y * sin_r
-            rotated_y = point.x * sin_r + point.y * cos_r
-            
-            # Translate to asteroid position
-            final_x = rotated_x + self.position.x
-            final_y = rotated_y + self.position.y
-            
-            transformed_points.append((final_x, final_y))
+        bucket = int(self.rotation / self.rotation_step) % len(self._rot_cache)
+        sprite = self._rot_cache[bucket]
+        if sprite is None:
+            sprite = self._render_rotation(bucket * self.rotation_step)
+            self._rot_cache[bucket] = sprite
         
-        pygame.draw.polygon(screen, WHITE, transformed_points, 2)
+        half = sprite.get_width() // 2
+        return sprite, (self.position.x - half, self.position.y - half)
+    
+    def _render_rotation(self, angle: float) -> pygame.Surface:
+        """Draw the outline rotated by angle degrees onto a transparent sprite"""
+        # Big enough for the furthest vertex at any rotation
+        size = int(self.radius * 1.3) * 2 + 4
+        
+        rad = math.radians(angle)
+        cos_r = math.cos(rad)
+        sin_r = math.sin(rad)
+        rotation_matrix = np.array([[cos_r, -sin_r], 
+                                    [sin_r, cos_r]])
+        points = self.shape @ rotation_matrix.T + size / 2
+        
+        sprite = pygame.Surface((size, size), pygame.SRCALPHA).convert_alpha()
+        pygame.draw.polygon(sprite, WHITE, points.tolist(), 2)
+        return sprite
 
 class AlienShip(GameObject):
+    __slots__ = ('shoot_timer', 'shoot_interval', 'direction_timer', 'direction_interval')
+    
+    _image = None
+    
     def __init__(self, x: float, y: float):
         super().__init__(x, y)
         self.radius = 12
@@ -403,9 +426,9 @@ class AlienShip(GameObject):
         
         # Set initial random velocity
         speed = random.uniform(50, 100)
-        angle = random.uniform(0, 360)
-        self.velocity.x = math.sin(math.radians(angle)) * speed
-        self.velocity.y = -math.cos(math.radians(angle)) * speed
+        i = random.randrange(360)
+        self.velocity.x = _SIN[i] * speed
+        self.velocity.y = _NCOS[i] * speed
     
     def update(self, dt: float):
         super().update(dt)
@@ -416,9 +439,9 @@ class AlienShip(GameObject):
         # Change direction periodically
         if self.direction_timer >= self.direction_interval:
             speed = random.uniform(50, 100)
-            angle = random.uniform(0, 360)
-            self.velocity.x = math.sin(math.radians(angle)) * speed
-            self.velocity.y = -math.cos(math.radians(angle)) * speed
+            i = random.randrange(360)
+            self.velocity.x = _SIN[i] * speed
+            self.velocity.y = _NCOS[i] * speed
             self.direction_timer = 0
             self.direction_interval = random.uniform(2.0, 4.0)
     
@@ -433,44 +456,160 @@ class AlienShip(GameObject):
         # Aim towards target with some inaccuracy
         dx = target_pos.x - self.position.x
         dy = target_pos.y - self.position.y
-        angle = math.degrees(math.atan2(dx, -dy))
+        angle = math.atan2(dx, -dy)
         
-        # Add some inaccuracy
-        angle += random.uniform(-30, 30)
+        # Add some inaccuracy (up to 30 degrees either way)
+        angle += random.uniform(-math.pi / 6, math.pi / 6)
         return angle
     
-    def draw(self, screen):
+    def sprite(self):
         if not self.active:
+            return None
+        
+        # Simple UFO shape, rendered once and shared by every alien
+        if AlienShip._image is None:
+            image = pygame.Surface((24, 16), pygame.SRCALPHA).convert_alpha()
+            pygame.draw.ellipse(image, WHITE, (0, 4, 24, 12), 2)
+            pygame.draw.ellipse(image, WHITE, (6, 0, 12, 8), 2)
+            AlienShip._image = image
+        return AlienShip._image, (int(self.position.x) - 12, int(self.position.y) - 10)
+
+class BulletPool:
+    """Bullets stored as parallel NumPy arrays (struct of arrays)
+    
+    Bullets are numerous and short-lived, so they are moved, expired and
+    collision tested a whole array at a time rather than one object at a time.
+    Inactive slots are reused for new bullets, and only slots below the
+    high-water mark `count` are processed.
+    """
+    speed = 400
+    lifetime = 2.0  # Bullets last 2 seconds
+    radius = 2
+    
+    _image = None
+    
+    def __init__(self, capacity: int = 256):
+        self.px = np.zeros(capacity)
+        self.py = np.zeros(capacity)
+        self.vx = np.zeros(capacity)
+        self.vy = np.zeros(capacity)
+        self.life = np.zeros(capacity, dtype=np.float32)
+        self.active = np.zeros(capacity, dtype=bool)
+        self.count = 0
+    
+    def _grow(self):
+        capacity = len(self.active)
+        for name in ("px", "py", "vx", "vy", "life", "active"):
+            old = getattr(self, name)
+            new = np.zeros(capacity * 2, dtype=old.dtype)
+            new[:capacity] = old
+            setattr(self, name, new)
+    
+    def spawn(self, x: float, y: float, rotation: float):
+        """Fire a bullet from (x, y) heading rotation radians clockwise from up"""
+        # Reuse the first dead slot, or extend the live region
+        free = np.flatnonzero(~self.active[:self.count])
+        if free.size:
+            i = free[0]
+        else:
+            if self.count == len(self.active):
+                self._grow()
+            i = self.count
+            self.count += 1
+        
+        # Set position and velocity based on rotation
+        self.px[i] = x
+        self.py[i] = y
+        heading = int(rotation * _LUT_PER_RADIAN) % 360
+        self.vx[i] = _SIN[heading] * self.speed
+        self.vy[i] = _NCOS[heading] * self.speed
+        self.life[i] = self.lifetime
+        self.active[i] = True
+    
+    def kill(self, i: int):
+        self.active[i] = False
+    
+    def clear(self):
+        self.active[:] = False
+        self.count = 0
+    
+    def update(self, dt: float):
+        n = self.count
+        if not n:
             return
         
-        # Draw simple UFO shape
-        center = (int(self.position.x), int(self.position.y))
-        pygame.draw.ellipse(screen, WHITE, 
-                          (center[0] - 12, center[1] - 6, 24, 12), 2)
-        pygame.draw.ellipse(screen, WHITE, 
-                          (center[0] - 6, center[1] - 10, 12, 8), 2)
+        # Move every bullet at once and wrap around game area edges
+        physics.step(self.px[:n], self.py[:n], self.vx[:n], self.vy[:n], self.active[:n], 
+                     dt, GAME_WIDTH, GAME_HEIGHT)
+        
+        # Expire old bullets
+        self.life[:n] -= dt
+        self.active[:n] &= self.life[:n] > 0
+        
+        # Pull the high-water mark back past trailing dead slots
+        live = np.flatnonzero(self.active[:n])
+        self.count = int(live[-1]) + 1 if live.size else 0
+    
+    def collisions(self, x: np.ndarray, y: np.ndarray, radius: np.ndarray, 
+                   active: np.ndarray) -> np.ndarray:
+        """Return (slot, target) index pairs of active bullets overlapping the given circles"""
+        n = self.count
+        return physics.bullet_hits(self.px[:n], self.py[:n], self.radius, self.active[:n], 
+                                   x, y, radius, active)
+    
+    def draw(self, screen) -> List[pygame.Rect]:
+        # Every bullet is the same dot, rendered once and blitted in one call
+        if BulletPool._image is None:
+            size = self.radius * 2
+            image = pygame.Surface((size, size), pygame.SRCALPHA).convert_alpha()
+            pygame.draw.circle(image, WHITE, (self.radius, self.radius), self.radius)
+            BulletPool._image = image
+        
+        live = np.flatnonzero(self.active[:self.count])
+        xs = (self.px[live].astype(np.intp) - self.radius).tolist()
+        ys = (self.py[live].astype(np.intp) - self.radius).tolist()
+        return screen.blits([(BulletPool._image, pos) for pos in zip(xs, ys)])
 
 class Game:
     def __init__(self):
-        self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+        # Sync presents to the display refresh where the platform supports it
+        try:
+            self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SCALED, vsync=1)
+        except pygame.error:
+            self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
         pygame.display.set_caption("Planetoids - ZX81 Classic Recreation")
         self.clock = pygame.time.Clock()
         
+        # run() only reacts to these; SDL drops everything else before it is queued.
+        # Held keys are read with key.get_pressed(), which does not need the queue.
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN])
+        
         # Create game surface (the actual game area)
-        self.game_surface = pygame.Surface((GAME_WIDTH, GAME_HEIGHT))
+        self.game_surface = pygame.Surface((GAME_WIDTH, GAME_HEIGHT)).convert()
         
         # Load ZX81 keyboard image
-        try:
-            self.keyboard_image = pygame.image.load("ZX81_keyboard.jpg")
-            # Scale keyboard to fit nicely at bottom
-            keyboard_width = WINDOW_WIDTH - 100
-            keyboard_height = int(keyboard_width * self.keyboard_image.get_height() / self.keyboard_image.get_width())
-            self.keyboard_image = pygame.transform.scale(self.keyboard_image, (keyboard_width, keyboard_height))
-        except pygame.error:
-            print("Could not load ZX81_keyboard.jpg - continuing without keyboard image")
-            self.keyboard_image = None
-        self.font = pygame.font.Font(None, 36)
-        self.small_font = pygame.font.Font(None, 24)
+        self.keyboard_image = self.load_keyboard_image(WINDOW_WIDTH - 100)
+        # FreeType fonts; sizes are in pixels (pygame.font scaled the default font's sizes)
+        self.font = pygame.freetype.Font(None, 24)
+        self.small_font = pygame.freetype.Font(None, 16)
+        
+        # Rendered text and its placed rect keyed by (text, color, font, center),
+        # least recently used first
+        self._text_cache: "OrderedDict[tuple, Tuple[pygame.Surface, pygame.Rect]]" = OrderedDict()
+        
+        # Menu and game over text composed into one surface per state, with
+        # the score it was composed for
+        self._overlays: Dict[GameState, Tuple[int, pygame.Surface]] = {}
+        
+        # The static window chrome is painted on the first frame only
+        self.chrome_drawn = False
+        
+        # Dirty-rect bookkeeping: the state on the game surface and the rects
+        # drawn there last frame, which are erased before the next one
+        self.drawn_state = None
+        self.drawn_rects: List[pygame.Rect] = []
+        self.rec_drawn = False
         
         # Initialize screen recorder
         self.recorder = None
@@ -482,9 +621,13 @@ class Game:
         self.sound_enabled = False
         try:
             pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+            
+            # Synthesize every sound effect up front so playing one is just .play()
+            self.sfx = {name: self.generate_sound(*params) for name, params in SOUND_EFFECTS.items()}
             self.sound_enabled = True
             print("✓ Sound system initialized successfully")
         except Exception as e:
+            self.sfx = {}
             print(f"⚠ Sound system unavailable: {e}")
             print("  Game will run without sound effects")
         
@@ -494,46 +637,71 @@ class Game:
         self.level = 1
         
         self.ship = None
-        self.bullets = []
+        self.bullets = BulletPool()
         self.asteroids = []
         self.alien_ships = []
-        self.alien_bullets = []
+        self.alien_bullets = BulletPool()
         
         self.alien_spawn_timer = 0
         self.alien_spawn_interval = 20.0  # Spawn alien every 20 seconds
         
         self.keys_pressed = set()
+        
+        # Key-down dispatch table for run(); held keys are polled in handle_input
+        self.running = False
+        self._key_handlers = {
+            pygame.K_ESCAPE: self._on_escape,
+            pygame.K_RETURN: self._on_return,
+            pygame.K_p: self._on_pause_toggle,
+            pygame.K_r: self.toggle_recording,
+        }
     
-    def generate_sound(self, frequency: int, duration: float, volume: float = 0.1):
-        """Generate a simple tone for sound effects"""
-        if not self.sound_enabled:
-            return
-            
+    def load_keyboard_image(self, width: int):
+        """Load the keyboard image scaled to width, reusing a scaled copy saved on disk"""
+        source = "ZX81_keyboard.jpg"
+        cache_path = f"ZX81_keyboard_{width}w.png"
         try:
-            sample_rate = 22050
-            frames = int(duration * sample_rate)
-            arr = []
-            for i in range(frames):
-                time_point = float(i) / sample_rate
-                wave = 4096 * math.sin(frequency * 2 * math.pi * time_point)
-                arr.append([int(wave), int(wave)])
+            # The cached copy is only good if it is newer than the source image
+            if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(source):
+                return pygame.image.load(cache_path).convert()
             
-            sound = pygame.sndarray.make_sound(pygame.array.array('i', arr))
-            sound.set_volume(volume)
-            sound.play()
-        except Exception as e:
-            print(f"Sound generation error: {e}")
-            self.sound_enabled = False  # Disable sound if it fails
+            image = pygame.image.load(source).convert()
+            # Scale keyboard to fit nicely at bottom
+            height = int(width * image.get_height() / image.get_width())
+            image = pygame.transform.smoothscale(image, (width, height))
+        except (pygame.error, OSError):
+            print(f"Could not load {source} - continuing without keyboard image")
+            return None
+        
+        try:
+            pygame.image.save(image, cache_path)
+        except pygame.error:
+            pass  # Read-only install; just scale again next time
+        return image
+    
+    def generate_sound(self, frequency: int, duration: float, volume: float = 0.1) -> pygame.mixer.Sound:
+        """Synthesize a simple tone for sound effects"""
+        sample_rate, _, channels = pygame.mixer.get_init()
+        t = np.arange(int(duration * sample_rate)) / sample_rate
+        wave = (4096 * np.sin(2 * np.pi * frequency * t)).astype(np.int16)
+        samples = wave if channels == 1 else np.repeat(wave[:, None], channels, axis=1)
+        
+        sound = pygame.sndarray.make_sound(samples)
+        sound.set_volume(volume)
+        return sound
+    
+    def play_sound(self, name: str):
+        """Play one of the pre-synthesized sound effects"""
+        if self.sound_enabled:
+            self.sfx[name].play()
     
     def play_shoot_sound(self):
         """Play shooting sound effect"""
-        self.generate_sound(600, 0.1, 0.05)
+        self.play_sound("shoot")
     
     def play_explosion_sound(self, size: int = 1):
         """Play explosion sound effect based on object size"""
-        base_freq = 150
-        duration = 0.2 + (size * 0.1)
-        self.generate_sound(base_freq, duration, 0.08)
+        self.play_sound(f"explosion_{size}")
     
     def toggle_recording(self):
         """Toggle screen recording on/off"""
@@ -570,7 +738,7 @@ class Game:
     
     def start_level(self):
         # Create ship
-        self.ship = Ship(GAME_WIDTH // 2, GAME_HEIGHT // 2)
+        self.ship = Ship(GAME_CX, GAME_CY)
         self.ship.invulnerable_time = 2.0  # 2 seconds of invulnerability
         self.ship.health = self.ship.max_health  # Full health for new level
         
@@ -590,20 +758,18 @@ class Game:
                 y = random.randint(50, GAME_HEIGHT - 50)
                 
                 # Make sure asteroid is not too close to ship
-                distance = math.sqrt((x - self.ship.position.x)**2 + 
-                                   (y - self.ship.position.y)**2)
-                if distance > 100:
+                dx = x - self.ship.position.x
+                dy = y - self.ship.position.y
+                if dx*dx + dy*dy > 100 * 100:
                     self.asteroids.append(Asteroid(x, y, 3))
                     break
         
         self.alien_spawn_timer = 0
     
-    def handle_input(self):
+    def handle_input(self, dt: float):
         keys = pygame.key.get_pressed()
         
         if self.state == GameState.PLAYING and self.ship and self.ship.active:
-            dt = self.clock.get_time() / 1000.0
-            
             # Rotation (8-directional movement support)
             if keys[pygame.K_LEFT] or keys[pygame.K_a]:
                 self.ship.rotate(-1, dt)
@@ -631,7 +797,7 @@ class Game:
                         if self.lives <= 0:
                             self.state = GameState.GAME_OVER
                         else:
-                            self.ship = Ship(GAME_WIDTH // 2, GAME_HEIGHT // 2)
+                            self.ship = Ship(GAME_CX, GAME_CY)
                             self.ship.invulnerable_time = 2.0
                             self.ship.health = self.ship.max_health
                 self.keys_pressed.add(pygame.K_h)
@@ -641,8 +807,7 @@ class Game:
     def shoot_bullet(self):
         if self.ship and self.ship.active:
             # Create bullet at ship position with ship rotation
-            bullet = Bullet(self.ship.position.x, self.ship.position.y, self.ship.rotation)
-            self.bullets.append(bullet)
+            self.bullets.spawn(self.ship.position.x, self.ship.position.y, self.ship.rotation)
             self.play_shoot_sound()
     
     def update(self, dt: float):
@@ -654,31 +819,24 @@ class Game:
             self.ship.update(dt)
         
         # Update bullets
-        for bullet in self.bullets[:]:
-            bullet.update(dt)
-            if not bullet.active:
-                self.bullets.remove(bullet)
+        self.bullets.update(dt)
         
         # Update asteroids
         for asteroid in self.asteroids:
             asteroid.update(dt)
         
         # Update alien ships
-        for alien in self.alien_ships[:]:
-            alien.update(dt)
+        for alien in self.alien_ships:
             if not alien.active:
-                self.alien_ships.remove(alien)
-            elif alien.should_shoot() and self.ship and self.ship.active:
+                continue
+            alien.update(dt)
+            if alien.should_shoot() and self.ship and self.ship.active:
                 # Alien shoots at player
                 angle = alien.get_shoot_angle(self.ship.position)
-                alien_bullet = Bullet(alien.position.x, alien.position.y, angle)
-                self.alien_bullets.append(alien_bullet)
+                self.alien_bullets.spawn(alien.position.x, alien.position.y, angle)
         
         # Update alien bullets
-        for bullet in self.alien_bullets[:]:
-            bullet.update(dt)
-            if not bullet.active:
-                self.alien_bullets.remove(bullet)
+        self.alien_bullets.update(dt)
         
         # Spawn aliens
         self.alien_spawn_timer += dt
@@ -689,6 +847,10 @@ class Game:
         # Check collisions
         self.check_collisions()
         
+        # Sweep out everything destroyed this frame in one pass per list
+        self.asteroids = [a for a in self.asteroids if a.active]
+        self.alien_ships = [a for a in self.alien_ships if a.active]
+        
         # Check level completion
         if not self.asteroids and not self.alien_ships:
             self.level += 1
@@ -701,7 +863,7 @@ class Game:
                 self.state = GameState.GAME_OVER
             else:
                 # Respawn ship with full health
-                self.ship = Ship(GAME_WIDTH // 2, GAME_HEIGHT // 2)
+                self.ship = Ship(GAME_CX, GAME_CY)
                 self.ship.invulnerable_time = 2.0
                 self.ship.health = self.ship.max_health
     
@@ -720,90 +882,113 @@ class Game:
         self.alien_ships.append(AlienShip(x, y))
     
     def check_collisions(self):
-        # Player bullets vs asteroids
-        for bullet in self.bullets[:]:
-            for asteroid in self.asteroids[:]:
-                if bullet.collides_with(asteroid):
-                    bullet.active = False
-                    asteroid.active = False
-                    
-                    # Score based on asteroid size
-                    score_values = {1: 100, 2: 50, 3: 20}
-                    self.score += score_values.get(asteroid.size, 20)
-                    
-                    # Play explosion sound
-                    self.play_explosion_sound(asteroid.size)
-                    
-                    # Split asteroid
-                    new_asteroids = asteroid.split()
-                    self.asteroids.extend(new_asteroids)
-                    
-                    self.bullets.remove(bullet)
-                    self.asteroids.remove(asteroid)
-                    break
-        
-        # Player bullets vs aliens
-        for bullet in self.bullets[:]:
-            for alien in self.alien_ships[:]:
-                if bullet.collides_with(alien):
-                    bullet.active = False
-                    alien.active = False
-                    self.score += 500  # High score for aliens
-                    
-                    # Play alien explosion sound
-                    self.play_explosion_sound(3)  # Large explosion for aliens
-                    
-                    self.bullets.remove(bullet)
-                    self.alien_ships.remove(alien)
-                    break
-        
-        # Ship vs asteroids
-        if (self.ship and self.ship.active and self.ship.invulnerable_time <= 0):
-            for asteroid in self.asteroids:
-                if self.ship.collides_with(asteroid):
-                    destroyed = self.ship.take_hit(DamageType.ASTEROID, damage=1, game=self)
-                    if destroyed:
-                        self.ship.active = False
-                    break
-        
-        # Ship vs aliens
-        if (self.ship and self.ship.active and self.ship.invulnerable_time <= 0):
-            for alien in self.alien_ships:
-                if self.ship.collides_with(alien):
-                    destroyed = self.ship.take_hit(DamageType.ALIEN_SHIP, damage=2, game=self)  # Aliens do more damage
-                    if destroyed:
-                        self.ship.active = False
-                    alien.active = False
-                    break
+        # Gather asteroid and alien circles into arrays so every bullet is
+        # tested against every target in one vectorized pass
+        targets = self.asteroids + self.alien_ships
+        target_x = np.fromiter((t.position.x for t in targets), dtype=float, count=len(targets))
+        target_y = np.fromiter((t.position.y for t in targets), dtype=float, count=len(targets))
+        target_r = np.fromiter((t.radius for t in targets), dtype=float, count=len(targets))
+        target_active = np.fromiter((t.active for t in targets), dtype=bool, count=len(targets))
+        
+        # Player bullets vs asteroids and aliens (pairs are ordered by bullet,
+        # then asteroids before aliens)
+        for slot, i in self.bullets.collisions(target_x, target_y, target_r, target_active):
+            target = targets[i]
+            if not (self.bullets.active[slot] and target.active):
+                continue
+            
+            self.bullets.kill(slot)
+            target.active = False
+            
+            if isinstance(target, Asteroid):
+                # Score based on asteroid size
+                score_values = {1: 100, 2: 50, 3: 20}
+                self.score += score_values.get(target.size, 20)
+                
+                # Play explosion sound
+                self.play_explosion_sound(target.size)
+                
+                # Split asteroid
+                new_asteroids = target.split()
+                self.asteroids.extend(new_asteroids)
+            else:
+                self.score += 500  # High score for aliens
+                
+                # Play alien explosion sound
+                self.play_explosion_sound(3)  # Large explosion for aliens
+        
+        # The ship can only be hit while it is alive and not invulnerable
+        ship = self.ship
+        ship_vulnerable = ship is not None and ship.active and ship.invulnerable_time <= 0
+        
+        # Ship vs asteroids and aliens
+        if ship_vulnerable and targets:
+            dx = target_x - ship.position.x
+            dy = target_y - ship.position.y
+            r = target_r + ship.radius
+            hit = next((targets[i] for i in np.flatnonzero(dx*dx + dy*dy < r*r) 
+                        if targets[i].active), None)
+            if hit is not None:
+                if isinstance(hit, Asteroid):
+                    destroyed = ship.take_hit(DamageType.ASTEROID, damage=1, game=self)
+                else:
+                    destroyed = ship.take_hit(DamageType.ALIEN_SHIP, damage=2, game=self)  # Aliens do more damage
+                    hit.active = False
+                if destroyed:
+                    ship.active = False
+                ship_vulnerable = False  # Now invulnerable for the rest of this frame
         
         # Ship vs alien bullets
-        if (self.ship and self.ship.active and self.ship.invulnerable_time <= 0):
-            for bullet in self.alien_bullets[:]:
-                if self.ship.collides_with(bullet):
-                    destroyed = self.ship.take_hit(DamageType.ALIEN_BULLET, damage=1, game=self)
-                    if destroyed:
-                        self.ship.active = False
-                    bullet.active = False
-                    self.alien_bullets.remove(bullet)
-                    break
+        if ship_vulnerable:
+            hits = self.alien_bullets.collisions(np.array([ship.position.x], dtype=float), 
+                                                 np.array([ship.position.y], dtype=float), 
+                                                 np.array([ship.radius], dtype=float), 
+                                                 np.ones(1, dtype=bool))
+            if len(hits):
+                destroyed = ship.take_hit(DamageType.ALIEN_BULLET, damage=1, game=self)
+                if destroyed:
+                    ship.active = False
+                self.alien_bullets.kill(hits[0, 0])
+    
+    def _render_cached(self, font, text: str, color: tuple) -> pygame.Surface:
+        """Render text through a small LRU cache of surfaces"""
+        return self._layout_cached(font, text, color)[0]
     
-    def draw_hud(self):
+    def _layout_cached(self, font, text: str, color: tuple, 
+                       center: Tuple[int, int] = None) -> Tuple[pygame.Surface, pygame.Rect]:
+        """Render text and place its rect at center, through a small LRU cache"""
+        key = (text, color, id(font), center)
+        entry = self._text_cache.get(key)
+        if entry is None:
+            surf, _ = font.render(text, color)
+            rect = surf.get_rect(center=center) if center else surf.get_rect()
+            entry = self._text_cache[key] = (surf, rect)
+            if len(self._text_cache) > TEXT_CACHE_SIZE:
+                self._text_cache.popitem(last=False)
+        else:
+            self._text_cache.move_to_end(key)
+        return entry
+    
+    def draw_hud(self) -> List[pygame.Rect]:
+        """Draw the HUD onto the game surface, returning the rects it covers"""
+        rects = []
+        
         # Score
-        score_text = self.font.render(f"Score: {self.score}", True, WHITE)
-        self.game_surface.blit(score_text, (10, 10))
+        score_text = self._render_cached(self.font, f"Score: {self.score}", WHITE)
+        rects.append(self.game_surface.blit(score_text, (10, 10)))
         
         # Lives
-        lives_text = self.font.render(f"Lives: {self.lives}", True, WHITE)
-        self.game_surface.blit(lives_text, (10, 50))
+        lives_text = self._render_cached(self.font, f"Lives: {self.lives}", WHITE)
+        rects.append(self.game_surface.blit(lives_text, (10, 50)))
         
         # Level
-        level_text = self.font.render(f"Level: {self.level}", True, WHITE)
-        self.game_surface.blit(level_text, (10, 90))
+        level_text = self._render_cached(self.font, f"Level: {self.level}", WHITE)
+        rects.append(self.game_surface.blit(level_text, (10, 90)))
         
         # Health display
         if self.ship:
-            health_text = self.small_font.render(f"Health: {self.ship.health}/{self.ship.max_health}", True, WHITE)
-            self.game_surface.blit(health_text, (10, 130))
+            health_text = self._render_cached(self.small_font, f"Health: {self.ship.health}/{self.ship.max_health}", WHITE)
+            rects.append(self.game_surface.blit(health_text, (10, 130)))
             
             # Health bar
             bar_width = 100
@@ -814,7 +999,7 @@ class Game:
             health_percent = self.ship.health / self.ship.max_health
             health_color = GREEN if health_percent > 0.6 else (YELLOW if health_percent > 0.3 else RED)
             
-            pygame.draw.rect(self.game_surface, WHITE, (bar_x, bar_y, bar_width, bar_height), 1)
+            rects.append(pygame.draw.rect(self.game_surface, WHITE, (bar_x, bar_y, bar_width, bar_height), 1))
             pygame.draw.rect(self.game_surface, health_color, 
                            (bar_x + 1, bar_y + 1, int((bar_width - 2) * health_percent), bar_height - 2))
         
@@ -823,8 +1008,9 @@ class Game:
             fuel_percent = self.ship.fuel / self.ship.max_fuel
             fuel_color = GREEN if fuel_percent > 0.3 else (RED if fuel_percent > 0.1 else RED)
             
-            fuel_text = self.small_font.render(f"Fuel: {int(fuel_percent * 100)}%", True, fuel_color)
-            self.game_surface.blit(fuel_text, (GAME_WIDTH - 120, 10))
+            # Fast-changing readouts are drawn straight onto the game surface
+            rects.append(self.small_font.render_to(self.game_surface, (GAME_WIDTH - 120, 10), 
+                                                   f"Fuel: {int(fuel_percent * 100)}%", fuel_color))
             
             # Fuel bar
             bar_width = 100
@@ -832,14 +1018,14 @@ class Game:
             bar_x = GAME_WIDTH - 120
             bar_y = 35
             
-            pygame.draw.rect(self.game_surface, WHITE, (bar_x, bar_y, bar_width, bar_height), 1)
+            rects.append(pygame.draw.rect(self.game_surface, WHITE, (bar_x, bar_y, bar_width, bar_height), 1))
             pygame.draw.rect(self.game_surface, fuel_color, 
                            (bar_x + 1, bar_y + 1, int((bar_width - 2) * fuel_percent), bar_height - 2))
         
         # Hyperspace cooldown
         if self.ship and self.ship.hyperspace_cooldown > 0:
-            cooldown_text = self.small_font.render(f"Hyperspace: {self.ship.hyperspace_cooldown:.1f}s", True, YELLOW)
-            self.game_surface.blit(cooldown_text, (GAME_WIDTH - 180, 55))
+            rects.append(self.small_font.render_to(self.game_surface, (GAME_WIDTH - 180, 55), 
+                                                   f"Hyperspace: {self.ship.hyperspace_cooldown:.1f}s", YELLOW))
         
         # Damage type indicator (for debugging/feedback)
         if self.ship and self.ship.hit_flash_time > 0 and self.ship.damage_type:
@@ -849,18 +1035,44 @@ class Game:
                 DamageType.ALIEN_BULLET: "Alien Fire!",
                 DamageType.HYPERSPACE: "Hyperspace Malfunction!"
             }
-            damage_text = self.small_font.render(damage_names.get(self.ship.damage_type, "Hit!"), True, self.ship.get_flash_color())
-            damage_rect = damage_text.get_rect(center=(GAME_WIDTH // 2, 50))
-            self.game_surface.blit(damage_text, damage_rect)
+            # Its color fades every frame, so it is drawn directly rather than cached
+            damage_text = damage_names.get(self.ship.damage_type, "Hit!")
+            damage_rect = self.small_font.get_rect(damage_text)
+            damage_rect.center = DAMAGE_TEXT_CENTER
+            rects.append(self.small_font.render_to(self.game_surface, damage_rect, damage_text, 
+                                                   self.ship.get_flash_color()))
+        
+        return rects
+    
+    def _overlay(self, state: GameState) -> pygame.Surface:
+        """Return the text screen for the menu or game over state, composing it on first use"""
+        # Only the game over screen shows the score, so only it is rebuilt when that changes
+        score = self.score if state == GameState.GAME_OVER else 0
+        cached = self._overlays.get(state)
+        if cached is None or cached[0] != score:
+            # These screens sit on a black game surface, so an opaque surface
+            # composes identically and blits faster than a per-pixel alpha one
+            surface = pygame.Surface((GAME_WIDTH, GAME_HEIGHT)).convert()
+            surface.fill(BLACK)
+            if state == GameState.MENU:
+                self._compose_menu(surface)
+            else:
+                self._compose_game_over(surface)
+            cached = self._overlays[state] = (score, surface)
+        return cached[1]
     
     def draw_menu(self):
-        title_text = self.font.render("PLANETOIDS", True, WHITE)
-        title_rect = title_text.get_rect(center=(GAME_WIDTH // 2, GAME_HEIGHT // 2 - 100))
-        self.game_surface.blit(title_text, title_rect)
+        self.game_surface.blit(self._overlay(GameState.MENU), (0, 0))
+    
+    def draw_game_over(self):
+        self.game_surface.blit(self._overlay(GameState.GAME_OVER), (0, 0))
+    
+    def _compose_menu(self, surface: pygame.Surface):
+        title_text, title_rect = self._layout_cached(self.font, "PLANETOIDS", WHITE, MENU_TITLE_CENTER)
+        surface.blit(title_text, title_rect)
         
-        subtitle_text = self.small_font.render("ZX81 Classic Recreation", True, WHITE)
-        subtitle_rect = subtitle_text.get_rect(center=(GAME_WIDTH // 2, GAME_HEIGHT // 2 - 70))
-        self.game_surface.blit(subtitle_text, subtitle_rect)
+        subtitle_text, subtitle_rect = self._layout_cached(self.small_font, "ZX81 Classic Recreation", WHITE, MENU_SUBTITLE_CENTER)
+        surface.blit(subtitle_text, subtitle_rect)
         
         instructions = [
             "Arrow Keys / WASD: Move and Rotate",
@@ -873,26 +1085,23 @@ class Game:
             "Press ENTER to Start"
         ]
         
-        y_offset = GAME_HEIGHT // 2 - 20
+        y_offset = MENU_INSTRUCTIONS_TOP
         for instruction in instructions:
             if instruction:
-                text = self.small_font.render(instruction, True, WHITE)
-                text_rect = text.get_rect(center=(GAME_WIDTH // 2, y_offset))
-                self.game_surface.blit(text, text_rect)
+                text, text_rect = self._layout_cached(self.small_font, instruction, WHITE, 
+                                                      (GAME_CX, y_offset))
+                surface.blit(text, text_rect)
             y_offset += 25
     
-    def draw_game_over(self):
-        game_over_text = self.font.render("GAME OVER", True, RED)
-        game_over_rect = game_over_text.get_rect(center=(GAME_WIDTH // 2, GAME_HEIGHT // 2 - 50))
-        self.game_surface.blit(game_over_text, game_over_rect)
+    def _compose_game_over(self, surface: pygame.Surface):
+        game_over_text, game_over_rect = self._layout_cached(self.font, "GAME OVER", RED, GAME_OVER_TITLE_CENTER)
+        surface.blit(game_over_text, game_over_rect)
         
-        final_score_text = self.font.render(f"Final Score: {self.score}", True, WHITE)
-        final_score_rect = final_score_text.get_rect(center=(GAME_WIDTH // 2, GAME_HEIGHT // 2))
-        self.game_surface.blit(final_score_text, final_score_rect)
+        final_score_text, final_score_rect = self._layout_cached(self.font, f"Final Score: {self.score}", WHITE, GAME_OVER_SCORE_CENTER)
+        surface.blit(final_score_text, final_score_rect)
         
-        restart_text = self.small_font.render("Press ENTER to Play Again or ESC to Quit", True, WHITE)
-        restart_rect = restart_text.get_rect(center=(GAME_WIDTH // 2, GAME_HEIGHT // 2 + 50))
-        self.game_surface.blit(restart_text, restart_rect)
+        restart_text, restart_rect = self._layout_cached(self.small_font, "Press ENTER to Play Again or ESC to Quit", WHITE, GAME_OVER_RESTART_CENTER)
+        surface.blit(restart_text, restart_rect)
     
     def draw_tv_frame(self):
         """Draw a retro CRT TV frame around the game area"""
@@ -918,62 +1127,96 @@ class Game:
                              GAME_WIDTH + 30 - 2*i, GAME_HEIGHT + 30 - 2*i), 1)
         
         # TV brand label
-        brand_font = pygame.font.Font(None, 24)
-        brand_text = brand_font.render("SINCLAIR", True, (200, 200, 200))
-        brand_rect = brand_text.get_rect(center=(WINDOW_WIDTH // 2, GAME_Y_OFFSET - 25))
-        self.screen.blit(brand_text, brand_rect)
+        brand_rect = self.small_font.get_rect("SINCLAIR")
+        brand_rect.center = BRAND_CENTER
+        self.small_font.render_to(self.screen, brand_rect, "SINCLAIR", (200, 200, 200))
     
-    def draw(self):
+    def draw_chrome(self):
+        """Paint the static parts of the window: background, TV frame and keyboard"""
         # Fill the entire window with a dark background
-        self.screen.fill((30, 30, 30))
-        
-        # Clear the game surface
-        self.game_surface.fill(BLACK)
-        
-        # Draw game content on the game surface
-        if self.state == GameState.MENU:
-            self.draw_menu()
-        elif self.state == GameState.PLAYING:
-            # Draw all game objects on the game surface
-            if self.ship:
-                self.ship.draw(self.game_surface)
-            
-            for bullet in self.bullets:
-                bullet.draw(self.game_surface)
-            
-            for asteroid in self.asteroids:
-                asteroid.draw(self.game_surface)
-            
-            for alien in self.alien_ships:
-                alien.draw(self.game_surface)
-            
-            for bullet in self.alien_bullets:
-                bullet.draw(self.game_surface)
-            
-            self.draw_hud()
-        elif self.state == GameState.GAME_OVER:
-            self.draw_game_over()
+        self.screen.fill(BACKGROUND_COLOR)
         
         # Draw the TV frame
         self.draw_tv_frame()
         
-        # Blit the game surface to the main screen (inside the TV)
-        self.screen.blit(self.game_surface, (GAME_X_OFFSET, GAME_Y_OFFSET))
-        
         # Draw the ZX81 keyboard at the bottom
         if self.keyboard_image:
             keyboard_y = GAME_Y_OFFSET + GAME_HEIGHT + 60
             keyboard_x = (WINDOW_WIDTH - self.keyboard_image.get_width()) // 2
             self.screen.blit(self.keyboard_image, (keyboard_x, keyboard_y))
+    
+    def draw_playing(self) -> List[pygame.Rect]:
+        """Draw game objects and HUD onto the game surface, returning the rects touched"""
+        # Draw all game objects on the game surface in one batched blit
+        ships = (self.ship,) if self.ship else ()
+        sprites = (obj.sprite() for obj in chain(ships, self.asteroids, self.alien_ships))
+        rects = self.game_surface.blits([item for item in sprites if item])
+        
+        rects += self.bullets.draw(self.game_surface)
+        rects += self.alien_bullets.draw(self.game_surface)
+        rects += self.draw_hud()
+        return rects
+    
+    def draw_game_area(self) -> List[pygame.Rect]:
+        """Update the game surface and copy it into the TV, returning the screen rects changed"""
+        # Repaint the whole game surface only when the state changes
+        full_redraw = self.state != self.drawn_state
+        if full_redraw:
+            self.game_surface.fill(BLACK)
+            self.drawn_state = self.state
+            self.drawn_rects = []
         
-        # Add recording indicator (on main screen, not game surface)
-        if self.recording:
-            # Draw red recording dot in top-right corner
-            pygame.draw.circle(self.screen, RED, (WINDOW_WIDTH - 20, 20), 8)
-            rec_text = self.small_font.render("REC", True, RED)
-            self.screen.blit(rec_text, (WINDOW_WIDTH - 60, 10))
-        
-        pygame.display.flip()
+        # Draw game content on the game surface
+        dirty = []
+        if self.state == GameState.PLAYING:
+            # Erase last frame's sprites and HUD, then draw this frame's;
+            # both sets of rects need to reach the display
+            for rect in self.drawn_rects:
+                self.game_surface.fill(BLACK, rect)
+            rects = self.draw_playing()
+            dirty = self.drawn_rects + rects
+            self.drawn_rects = rects
+        elif full_redraw:
+            # Menu and game over screens are static once painted
+            if self.state == GameState.MENU:
+                self.draw_menu()
+            elif self.state == GameState.GAME_OVER:
+                self.draw_game_over()
+        
+        # Copy the changed parts of the game surface to the main screen (inside the TV)
+        if full_redraw:
+            self.screen.blit(self.game_surface, GAME_RECT)
+            screen_dirty = [GAME_RECT]
+        else:
+            screen_dirty = [self.screen.blit(self.game_surface, rect.move(GAME_RECT.topleft), rect) 
+                            for rect in dirty]
+        return screen_dirty
+    
+    def draw(self):
+        if not self.chrome_drawn:
+            self.draw_chrome()
+        
+        # A paused game keeps its last frame on screen; only the REC indicator can change
+        screen_dirty = [] if self.state == GameState.PAUSED else self.draw_game_area()
+        
+        # Add recording indicator (on main screen, not game surface) when toggled
+        if self.recording != self.rec_drawn:
+            self.screen.fill(BACKGROUND_COLOR, REC_RECT)
+            if self.recording:
+                # Draw red recording dot in top-right corner
+                pygame.draw.circle(self.screen, RED, (WINDOW_WIDTH - 20, 20), 8)
+                rec_text = self._render_cached(self.small_font, "REC", RED)
+                self.screen.blit(rec_text, (WINDOW_WIDTH - 60, 10))
+            screen_dirty.append(REC_RECT)
+            self.rec_drawn = self.recording
+        
+        # Only changed rects reach the display; static frames present nothing
+        if self.chrome_drawn:
+            if screen_dirty:
+                pygame.display.update(screen_dirty)
+        else:
+            pygame.display.flip()
+            self.chrome_drawn = True
         
         # Capture frame for recording (capture the entire window)
         if self.recording and self.recorder:
@@ -984,38 +1227,44 @@ class Game:
                 self.recording = False
                 self.recorder = None
     
+    def _on_escape(self):
+        """Quit the game"""
+        self.running = False
+    
+    def _on_return(self):
+        """Start a new game from the menu or game over screen"""
+        if self.state in (GameState.MENU, GameState.GAME_OVER):
+            self.reset_game()
+            self.state = GameState.PLAYING
+    
+    def _on_pause_toggle(self):
+        """Pause or resume the current game"""
+        self.state = PAUSE_TOGGLE.get(self.state, self.state)
+    
     def run(self):
-        running = True
-        
-        while running:
-            dt = self.clock.tick(FPS) / 1000.0
+        self.running = True
+        accumulator = 0.0
+        
+        while self.running:
+            # Nothing animates outside of play, so idle screens run at a lower rate
+            frame_time = self.clock.tick(FPS if self.state == GameState.PLAYING else IDLE_FPS) / 1000.0
+            # After a long stall (window drag, breakpoint) drop time rather than fast-forward
+            accumulator += min(frame_time, MAX_FRAME_TIME)
             
             # Handle events
             for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        running = False
-                    elif event.key == pygame.K_RETURN:
-                        if self.state == GameState.MENU:
-                            self.reset_game()
-                            self.state = GameState.PLAYING
-                        elif self.state == GameState.GAME_OVER:
-                            self.reset_game()
-                            self.state = GameState.PLAYING
-                    elif event.key == pygame.K_p and self.state == GameState.PLAYING:
-                        self.state = GameState.PAUSED
-                    elif event.key == pygame.K_p and self.state == GameState.PAUSED:
-                        self.state = GameState.PLAYING
-                    elif event.key == pygame.K_r:
-                        self.toggle_recording()
-            
-            # Handle continuous input
-            self.handle_input()
+                if event.type == pygame.KEYDOWN:
+                    handler = self._key_handlers.get(event.key)
+                    if handler:
+                        handler()
+                elif event.type == pygame.QUIT:
+                    self.running = False
             
-            # Update game
-            self.update(dt)
+            # Step input and simulation at a fixed rate, however long the frame took
+            while accumulator >= FIXED_DT:
+                self.handle_input(FIXED_DT)
+                self.update(FIXED_DT)
+                accumulator -= FIXED_DT
             
             # Draw everything
             self.draw()
@@ -1027,10 +1276,11 @@ class Game:
                 print("Recording stopped and saved!")
             except Exception as e:
                 print(f"Error stopping recording: {e}")
-        
-        pygame.quit()
-        sys.exit()
 
 if __name__ == "__main__":
     game = Game()
     game.run()
+    
+    # Stop the audio thread before the rest of pygame shuts down
+    pygame.mixer.quit()
+    pygame.quit()
@@ -3,7 +3,7 @@
 Test script to check if pygame sound system is working
 """
 import pygame
-import math
+import numpy as np
 import time
 
 def test_sound():
@@ -22,18 +22,18 @@ def test_sound():
     try:
         print("Generating test sound...")
         
-        # Generate a simple beep
-        sample_rate = 22050
+        # Generate a simple beep in the format the mixer actually opened with
+        sample_rate, _, channels = pygame.mixer.get_init()
         frequency = 440  # A note
         duration = 0.5
         frames = int(duration * sample_rate)
         
-        arr = []
-        for i in range(frames):
-            wave = 4096 * math.sin(frequency * 2 * math.pi * i / sample_rate)
-            arr.append([int(wave), int(wave)])
+        t = np.arange(frames, dtype=np.float32)
+        wave = (4096 * np.sin(2 * np.pi * frequency * t / sample_rate)).astype(np.int16)
+        # A flat int16 array for mono, else one C-contiguous column per channel
+        samples = wave if channels == 1 else np.repeat(wave[:, None], channels, axis=1)
         
-        sound = pygame.sndarray.make_sound(pygame.array.array('i', arr))
+        sound = pygame.sndarray.make_sound(samples)
         sound.set_volume(0.3)
         
         print("Playing test sound...")
@@ -49,25 +49,39 @@ def test_sound():
         print(f"✗ Sound generation failed: {e}")
         return False
 
+# Generated test tones by frequency, so replaying a tone is a lookup
+_tone_cache = {}
+
 def test_multiple_sounds():
     """Test different frequencies like the game uses"""
     frequencies = [200, 400, 600, 800, 1200]  # From the game
     
+    mixer_settings = pygame.mixer.get_init()
+    if not mixer_settings:
+        print("✗ Mixer not initialized - skipping tone synthesis")
+        return
+    sample_rate, _, channels = mixer_settings
+    
+    # Every tone shares sample rate and duration, so the phase ramp is
+    # computed once and only scaled by each frequency
+    duration = 0.2
+    frames = int(duration * sample_rate)
+    phase = (2 * np.pi / sample_rate) * np.arange(frames, dtype=np.float32)
+    
     for freq in frequencies:
         try:
             print(f"Testing {freq}Hz...")
             
-            sample_rate = 22050
-            duration = 0.2
-            frames = int(duration * sample_rate)
-            
-            arr = []
-            for i in range(frames):
-                wave = 4096 * math.sin(freq * 2 * math.pi * i / sample_rate)
-                arr.append([int(wave), int(wave)])
-            
-            sound = pygame.sndarray.make_sound(pygame.array.array('i', arr))
-            sound.set_volume(0.1)
+            sound = _tone_cache.get(freq)
+            if sound is None:
+                wave = np.sin(phase * freq, dtype=np.float32)
+                wave *= 4096
+                wave = wave.astype(np.int16)
+                samples = wave if channels == 1 else np.repeat(wave[:, None], channels, axis=1)
+                
+                sound = pygame.sndarray.make_sound(samples)
+                sound.set_volume(0.1)
+                _tone_cache[freq] = sound
             sound.play()
             
             time.sleep(0.3)  # Brief pause between sounds
@@ -85,4 +99,5 @@ if __name__ == "__main__":
     else:
         print("\n✗ Basic sound test failed - check your audio system")
     
+    pygame.mixer.quit()
     pygame.quit()
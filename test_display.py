@@ -2,6 +2,8 @@
 """
 Quick test to verify the display layout works correctly
 """
+import os
+import numpy as np
 import pygame
 import sys
 
@@ -28,19 +30,92 @@ def main():
     font = pygame.font.Font(None, 36)
     small_font = pygame.font.Font(None, 24)
     
-    # Load keyboard image
+    # Load keyboard image, reusing a scaled copy saved by an earlier run
+    keyboard_width = WINDOW_WIDTH - 100
+    cache_path = f"ZX81_keyboard_{keyboard_width}w.png"
     try:
-        keyboard_image = pygame.image.load("ZX81_keyboard.jpg")
-        keyboard_width = WINDOW_WIDTH - 100
-        keyboard_height = int(keyboard_width * keyboard_image.get_height() / keyboard_image.get_width())
-        keyboard_image = pygame.transform.scale(keyboard_image, (keyboard_width, keyboard_height))
+        if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime("ZX81_keyboard.jpg"):
+            keyboard_image = pygame.image.load(cache_path).convert()
+        else:
+            # Convert to the display's pixel format so blits skip per-pixel conversion
+            keyboard_image = pygame.image.load("ZX81_keyboard.jpg").convert()
+            keyboard_height = int(keyboard_width * keyboard_image.get_height() / keyboard_image.get_width())
+            keyboard_image = pygame.transform.smoothscale(keyboard_image, (keyboard_width, keyboard_height))
+            try:
+                pygame.image.save(keyboard_image, cache_path)
+            except pygame.error:
+                pass  # Read-only checkout; just scale again next time
         print(f"Keyboard image loaded: {keyboard_image.get_size()}")
-    except pygame.error as e:
+    except (pygame.error, OSError) as e:
         print(f"Could not load keyboard image: {e}")
         keyboard_image = None
     
+    # Everything outside the game area is static, so draw it once
+    background = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+    
+    # Fill background
+    background.fill((30, 30, 30))
+    
+    # Draw TV frame
+    tv_frame_color = (40, 40, 40)
+    tv_inner_color = (20, 20, 20)
+    
+    # Outer TV case
+    pygame.draw.rect(background, tv_frame_color, 
+                    (GAME_X_OFFSET - 40, GAME_Y_OFFSET - 40, 
+                     GAME_WIDTH + 80, GAME_HEIGHT + 80))
+    
+    # Inner bezel
+    pygame.draw.rect(background, tv_inner_color, 
+                    (GAME_X_OFFSET - 20, GAME_Y_OFFSET - 20, 
+                     GAME_WIDTH + 40, GAME_HEIGHT + 40))
+    
+    # Screen bezel: five concentric 1-pixel rings, rasterized in one pass.
+    # A pixel is on a ring when it lies within 5 pixels of the bezel's edge.
+    bezel_color = (60, 60, 60)
+    bezel_width, bezel_height = GAME_WIDTH + 30, GAME_HEIGHT + 30
+    x = np.arange(bezel_width)[:, None]
+    y = np.arange(bezel_height)[None, :]
+    edge_distance = np.minimum(np.minimum(x, bezel_width - 1 - x), np.minimum(y, bezel_height - 1 - y))
+    rings = edge_distance < 5
+    
+    bezel = pygame.Surface((bezel_width, bezel_height), pygame.SRCALPHA)
+    pixels = pygame.surfarray.pixels3d(bezel)
+    alpha = pygame.surfarray.pixels_alpha(bezel)
+    pixels[rings] = bezel_color
+    alpha[rings] = 255
+    del pixels, alpha  # Release the surface lock before blitting
+    background.blit(bezel, (GAME_X_OFFSET - 15, GAME_Y_OFFSET - 15))
+    
+    # TV brand label
+    brand_text = small_font.render("SINCLAIR", True, (200, 200, 200))
+    brand_rect = brand_text.get_rect(center=(WINDOW_WIDTH // 2, GAME_Y_OFFSET - 25))
+    background.blit(brand_text, brand_rect)
+    
+    # Draw keyboard
+    if keyboard_image:
+        keyboard_y = GAME_Y_OFFSET + GAME_HEIGHT + 60
+        keyboard_x = (WINDOW_WIDTH - keyboard_image.get_width()) // 2
+        background.blit(keyboard_image, (keyboard_x, keyboard_y))
+    
     # Create game surface
-    game_surface = pygame.Surface((GAME_WIDTH, GAME_HEIGHT))
+    game_surface = pygame.Surface((GAME_WIDTH, GAME_HEIGHT)).convert()
+    
+    # Fill game surface with test content
+    game_surface.fill(BLACK)
+    
+    # Test content on game surface
+    title_text = font.render("PLANETOIDS", True, WHITE)
+    title_rect = title_text.get_rect(center=(GAME_WIDTH // 2, GAME_HEIGHT // 2 - 50))
+    game_surface.blit(title_text, title_rect)
+    
+    subtitle_text = small_font.render("ZX81 Classic Recreation", True, GREEN)
+    subtitle_rect = subtitle_text.get_rect(center=(GAME_WIDTH // 2, GAME_HEIGHT // 2))
+    game_surface.blit(subtitle_text, subtitle_rect)
+    
+    info_text = small_font.render("Display Test - Press ESC to exit", True, WHITE)
+    info_rect = info_text.get_rect(center=(GAME_WIDTH // 2, GAME_HEIGHT // 2 + 50))
+    game_surface.blit(info_text, info_rect)
     
     running = True
     while running:
@@ -51,60 +126,11 @@ def main():
                 if event.key == pygame.K_ESCAPE:
                     running = False
         
-        # Fill background
-        screen.fill((30, 30, 30))
-        
-        # Draw TV frame
-        tv_frame_color = (40, 40, 40)
-        tv_inner_color = (20, 20, 20)
-        
-        # Outer TV case
-        pygame.draw.rect(screen, tv_frame_color, 
-                        (GAME_X_OFFSET - 40, GAME_Y_OFFSET - 40, 
-                         GAME_WIDTH + 80, GAME_HEIGHT + 80))
-        
-        # Inner bezel
-        pygame.draw.rect(screen, tv_inner_color, 
-                        (GAME_X_OFFSET - 20, GAME_Y_OFFSET - 20, 
-                         GAME_WIDTH + 40, GAME_HEIGHT + 40))
-        
-        # Screen bezel
-        bezel_color = (60, 60, 60)
-        for i in range(5):
-            pygame.draw.rect(screen, bezel_color, 
-                            (GAME_X_OFFSET - 15 + i, GAME_Y_OFFSET - 15 + i, 
-                             GAME_WIDTH + 30 - 2*i, GAME_HEIGHT + 30 - 2*i), 1)
-        
-        # TV brand label
-        brand_text = small_font.render("SINCLAIR", True, (200, 200, 200))
-        brand_rect = brand_text.get_rect(center=(WINDOW_WIDTH // 2, GAME_Y_OFFSET - 25))
-        screen.blit(brand_text, brand_rect)
-        
-        # Fill game surface with test content
-        game_surface.fill(BLACK)
-        
-        # Test content on game surface
-        title_text = font.render("PLANETOIDS", True, WHITE)
-        title_rect = title_text.get_rect(center=(GAME_WIDTH // 2, GAME_HEIGHT // 2 - 50))
-        game_surface.blit(title_text, title_rect)
-        
-        subtitle_text = small_font.render("ZX81 Classic Recreation", True, GREEN)
-        subtitle_rect = subtitle_text.get_rect(center=(GAME_WIDTH // 2, GAME_HEIGHT // 2))
-        game_surface.blit(subtitle_text, subtitle_rect)
-        
-        info_text = small_font.render("Display Test - Press ESC to exit", True, WHITE)
-        info_rect = info_text.get_rect(center=(GAME_WIDTH // 2, GAME_HEIGHT // 2 + 50))
-        game_surface.blit(info_text, info_rect)
+        screen.blit(background, (0, 0))
         
         # Blit game surface to main screen
         screen.blit(game_surface, (GAME_X_OFFSET, GAME_Y_OFFSET))
         
-        # Draw keyboard
-        if keyboard_image:
-            keyboard_y = GAME_Y_OFFSET + GAME_HEIGHT + 60
-            keyboard_x = (WINDOW_WIDTH - keyboard_image.get_width()) // 2
-            screen.blit(keyboard_image, (keyboard_x, keyboard_y))
-        
         pygame.display.flip()
         clock.tick(60)
     